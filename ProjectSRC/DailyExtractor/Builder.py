@@ -1,4 +1,3 @@
-import datetime
 from abc import ABC
 from typing import Any
 
@@ -6,15 +5,24 @@ import pandas as pd  # type: ignore
 from openpyxl import load_workbook  # type: ignore
 
 from ProjectSRC.DailyExtractor.Product import LabResult  # type: ignore
+from ProjectSRC.DailyExtractor.Validator import (  # type: ignore
+    CellError,
+    SheetValidator,
+)
 
 
 # Interface
 class ExcelAdapter(ABC):
     """یک کلاس پایه که همه ادپتر های زیر مجموعه باید از آن ارث ببرند"""
 
-    def get_records(self):
+    def get_sheets(self):
+        """برای هر شیت یک جفت (نام شیت، داده‌های خام) برمی‌گرداند"""
         raise NotImplementedError
 
+    def get_records(self):
+        for _, sheet_data in self.get_sheets():
+            yield sheet_data
+
 
 # Adapter with openpyxl
 class Openpyxl(ExcelAdapter):
@@ -25,7 +33,7 @@ class Openpyxl(ExcelAdapter):
         self.start = start
         self.end = end
 
-    def get_records(self):
+    def get_sheets(self):
         wb = load_workbook(filename=self.file_path, data_only=True, read_only=True)
         try:
             sheet_names = wb.sheetnames
@@ -33,7 +41,7 @@ class Openpyxl(ExcelAdapter):
             for sheet in active_sheets:
                 ws = wb[sheet]
                 cell_range = ws["A4":"L31"]
-                yield [[cell.value for cell in ls] for ls in cell_range]
+                yield sheet, [[cell.value for cell in ls] for ls in cell_range]
         finally:
             wb.close()
 
@@ -46,7 +54,7 @@ class Pandas(ExcelAdapter):
         self.start = start
         self.end = end
 
-    def get_records(self):
+    def get_sheets(self):
         # خواندن کل فایل اکسل
         xls = pd.ExcelFile(self.file_path)
         sheet_names = xls.sheet_names
@@ -62,7 +70,7 @@ class Pandas(ExcelAdapter):
                 usecols="A:L",
             )
             sheet_data = df.values.tolist()
-            yield sheet_data
+            yield sheet, sheet_data
 
 
 # Facade
@@ -75,27 +83,31 @@ class ExcelAdapterFacade:
         else:
             raise ValueError("Engine must be 'pandas' or 'openpyxl'")
 
+    def get_sheets(self):
+        return self.adapter.get_sheets()
+
     def get_records(self):
         return self.adapter.get_records()
 
 
 class LabResultBuilder:
-    def __init__(self, raw_data: list[list]):
+    def __init__(self, raw_data: list[list], sheet: str = ""):
         self.raw_data = raw_data
+        self.sheet = sheet
+        self.errors: list[CellError] = []
         self._records: list[dict[str, Any]] = []
 
     def parse(self):
-        date = self.raw_data[0][4]  # '1404/07/02'
-        year, month, day = str(date).split("/")
-
-        for i, ls in enumerate(self.raw_data):
-
-            if i < 8:
-                continue
-
-            if isinstance(ls[0], (datetime.time, datetime.datetime)):
-                time = ls[0].strftime("%H%M")
-            else:
+        # تاریخ E4 (مثلا '1404/07/02')، ستون ساعت و ستون‌های عددی یک بار برای کل شیت بررسی می‌شوند
+        validator = SheetValidator(self.raw_data, sheet=self.sheet).validate()
+        self.errors = validator.errors
+        if validator.date is None:
+            return self
+
+        year, month, day = validator.date
+        for i, time in validator.times.items():
+            # ردیفی که همه ستون‌های اصلی آن در اکسل خالی است ثبت نمی‌شود
+            if i not in validator.filled:
                 continue
 
             record = {
@@ -103,32 +115,15 @@ class LabResultBuilder:
                 "month": month,
                 "day": day,
                 "time": time,
-                "klin1": str(ls[1]) if ls[1] is not None else "Not Tested",
-                "klin2": str(ls[3]) if ls[3] is not None else "Not Tested",
-                "above40": (str(ls[5]) if ls[5] is not None else "Not Tested"),
-                "par05": (
-                    str(self.raw_data[i + 1][8])
-                    if 7 < i < 20 and self.raw_data[i + 1][8] is not None
-                    else "Not Tested"
-                ),
-                "par51": (
-                    str(self.raw_data[i + 1][9])
-                    if 7 < i < 20 and self.raw_data[i + 1][9] is not None
-                    else "Not Tested"
-                ),
-                "par60": str(ls[11]) if ls[11] is not None else "Not Tested",
+                **{field: values[i] for field, values in validator.values.items()},
             }
-
-            fields = ["klin1", "klin2", "above40", "par05"]
-            if all(record[f] == "Not Tested" for f in fields):
-                continue
-
             self._records.append(record)
 
         return self
 
     def build(self) -> list[LabResult]:
-        return [LabResult(**rec) for rec in self._records]
+        # داده‌ها قبلا در SheetValidator اعتبارسنجی شده‌اند؛ فقط model_post_init اجرا می‌شود
+        return [LabResult.model_construct(**rec) for rec in self._records]
 
 
 # openpyxl adaptor test:
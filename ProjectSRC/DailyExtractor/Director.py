@@ -1,5 +1,7 @@
 # import sqlite3
 # import toml  # type: ignore
+import time
+
 from pydantic import BaseModel
 
 from ProjectSRC.DailyExtractor.Builder import (  # type: ignore
@@ -11,6 +13,7 @@ from ProjectSRC.DailyExtractor.Saver import (  # type: ignore
     SqliteSaver,
     TomlSaver,
 )
+from ProjectSRC.DailyExtractor.Validator import CellError  # type: ignore
 
 
 # Director - from Builder Pattern
@@ -23,8 +26,14 @@ class LabResultManager(BaseModel):
     end_day: int = 31
     extract_engine: str = "openpyxl"
     excel_data: list[list] = []
+    sheet_names: list[str] = []
     saver_engine: str = "csv"
     output: str = r"DataBase\csvdatabase.csv"
+    # زمان صرف شده در هر مرحله (ثانیه) و تعداد رکوردهای ذخیره شده
+    timings: dict[str, float] = {}
+    saved_records: int = 0
+    # خطاهای اعتبارسنجی با مختصات شیت/سطر/ستون
+    validation_errors: list[CellError] = []
 
     def _extract_data(self):
         facade = ExcelAdapterFacade(
@@ -33,7 +42,9 @@ class LabResultManager(BaseModel):
             end=self.end_day,
             engine=self.extract_engine,
         )
-        self.excel_data = list(facade.get_records())
+        sheets = list(facade.get_sheets())
+        self.sheet_names = [sheet for sheet, _ in sheets]
+        self.excel_data = [sheet_data for _, sheet_data in sheets]
         return self.excel_data
 
     def _select_saver(self):
@@ -51,15 +62,28 @@ class LabResultManager(BaseModel):
 
     def save_results(self):
         saver = self._select_saver()
+        self.timings = {"extract": 0.0, "parse": 0.0, "save": 0.0}
+        self.saved_records = 0
+        self.validation_errors = []
+
+        started = time.perf_counter()
         self._extract_data()
+        self.timings["extract"] = time.perf_counter() - started
 
         if isinstance(saver, CsvSaver):
             with saver as s:
-                for days in self.excel_data:
-                    data_parser_object = LabResultBuilder(days)
+                for sheet, days in zip(self.sheet_names, self.excel_data):
+                    started = time.perf_counter()
+                    data_parser_object = LabResultBuilder(days, sheet=sheet)
                     lab_result = data_parser_object.parse().build()
+                    self.validation_errors.extend(data_parser_object.errors)
+                    self.timings["parse"] += time.perf_counter() - started
+
+                    started = time.perf_counter()
                     for data in lab_result:
                         s.save(data)
+                        self.saved_records += 1
+                    self.timings["save"] += time.perf_counter() - started
 
 
 # if __name__ == "__main__":
@@ -0,0 +1,424 @@
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging.handlers import QueueHandler, QueueListener
+from urllib.parse import parse_qs, urlparse
+
+from pydantic import BaseModel
+
+from ProjectSRC.DailyExtractor.Director import LabResultManager  # type: ignore
+from ProjectSRC.DailyExtractor.Validator import CellError  # type: ignore
+from ProjectSRC.Logger.logger_config import logger  # type: ignore
+
+# سرویس HTTP محلی برای دریافت فایل‌های daily.xlsx و پردازش آن‌ها در صف
+# نمونه ارسال فایل:
+# curl --data-binary @daily.xlsx "http://127.0.0.1:8000/jobs?start_day=1&end_day=31"
+
+# TomlSaver و SqliteSaver هنوز پیاده‌سازی نشده‌اند و save_results فقط با CsvSaver می‌نویسد
+SAVER_EXTENSIONS = {"csv": "csv"}
+
+
+class Job(BaseModel):
+    """وضعیت یک فایل ارسال شده در صف پردازش"""
+
+    job_id: str
+    daily_file: str
+    output: str
+    start_day: int = 1
+    end_day: int = 31
+    status: str = "queued"  # queued / running / done / failed
+    error: str | None = None
+    saved_records: int = 0
+    validation_errors: list[CellError] = []
+    created_at: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+    # queued: زمان انتظار در صف و بقیه مراحل از LabResultManager
+    timings: dict[str, float] = {}
+
+
+def _init_worker(log_queue):
+    """لاگ‌های پردازش worker از طریق صف به پردازش اصلی فرستاده می‌شوند
+    تا فقط یک پردازش در فایل چرخشی لاگ بنویسد"""
+
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+
+
+def run_job(
+    daily_file: str,
+    start_day: int,
+    end_day: int,
+    extract_engine: str,
+    saver_engine: str,
+    output: str,
+) -> dict:
+    """در پردازش worker اجرا می‌شود؛ خروجی باید قابل pickle باشد"""
+
+    manager = LabResultManager(
+        daily_file=daily_file,
+        start_day=start_day,
+        end_day=end_day,
+        extract_engine=extract_engine,
+        saver_engine=saver_engine,
+        output=output,
+    )
+    error = None
+    try:
+        manager.save_results()
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    return {
+        "error": error,
+        "saved_records": manager.saved_records,
+        "timings": manager.timings,
+        "validation_errors": [err.model_dump() for err in manager.validation_errors],
+    }
+
+
+class JobQueue:
+    """صف محدود؛ هر thread یک کار را از صف برمی‌دارد و آن را در pool پردازش‌ها اجرا می‌کند.
+    پردازش اکسل CPU-bound است، پس موازی‌سازی واقعی فقط با چند پردازش ممکن است"""
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_queue: int = 100,
+        extract_engine: str = "openpyxl",
+        saver_engine: str = "csv",
+        upload_dir: str = os.path.join("DataBase", "uploads"),
+        output_dir: str = os.path.join("DataBase", "jobs"),
+        keep_jobs: int = 1000,
+    ):
+        if saver_engine not in SAVER_EXTENSIONS:
+            raise ValueError(f"Saver engine must be one of: {', '.join(SAVER_EXTENSIONS)}")
+
+        self.extract_engine = extract_engine
+        self.saver_engine = saver_engine
+        self.upload_dir = upload_dir
+        self.output_dir = output_dir
+        # تعداد کارهای تمام شده‌ای که وضعیتشان نگه داشته می‌شود
+        self.keep_jobs = keep_jobs
+        self.jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[str] = queue.Queue(maxsize=max_queue)
+        self._stopping = threading.Event()
+        # fork در کنار thread های سرور امن نیست، پس پردازش‌ها با spawn ساخته می‌شوند
+        self._context = multiprocessing.get_context("spawn")
+        self._log_queue = self._context.Queue()
+        self._log_listener = QueueListener(
+            self._log_queue, *logger.handlers, respect_handler_level=True
+        )
+        self._pool_size = workers
+        self._pool_lock = threading.Lock()
+        self._pool = self._new_pool()
+        self._workers = [
+            threading.Thread(target=self._work, name=f"fsm-worker-{i + 1}", daemon=True)
+            for i in range(workers)
+        ]
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self._pool_size,
+            mp_context=self._context,
+            initializer=_init_worker,
+            initargs=(self._log_queue,),
+        )
+
+    def _replace_pool(self, broken: ProcessPoolExecutor):
+        """اگر یک پردازش worker بمیرد (مثلا OOM) کل pool خراب می‌شود و باید از نو ساخته شود"""
+
+        with self._pool_lock:
+            # ممکن است thread دیگری قبلا pool را عوض کرده باشد
+            if self._pool is not broken or self._stopping.is_set():
+                return
+            self._pool = self._new_pool()
+        broken.shutdown(wait=False, cancel_futures=True)
+        logger.warning("[JobQueue] [Pool] Worker process died, process pool recreated")
+
+    def start(self):
+        os.makedirs(self.upload_dir, exist_ok=True)
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._log_listener.start()
+        for worker in self._workers:
+            worker.start()
+        logger.info(f"[JobQueue] [Start] Workers={len(self._workers)}")
+        return self
+
+    def stop(self):
+        # thread ها بعد از تمام شدن کار فعلی از حلقه خارج می‌شوند؛ چیزی در صف پر قرار داده نمی‌شود
+        self._stopping.set()
+        for worker in self._workers:
+            worker.join()
+        self._pool.shutdown(cancel_futures=True)
+
+        # کارهایی که هنوز در صف مانده‌اند اجرا نمی‌شوند
+        while True:
+            try:
+                job_id = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                job = self.jobs[job_id]
+                job.status = "failed"
+                job.error = "Service stopped before the job was processed"
+                job.finished_at = time.time()
+            try:
+                os.remove(job.daily_file)
+            except OSError:
+                pass
+        self._log_listener.stop()
+        logger.info("[JobQueue] [Stop] All workers stopped")
+
+    def submit(self, content: bytes, start_day: int = 1, end_day: int = 31) -> Job:
+        """فایل را روی دیسک ذخیره و در صف قرار می‌دهد؛ اگر صف پر باشد queue.Full برمی‌گردد"""
+
+        if not (1 <= start_day <= end_day <= 31):
+            raise ValueError("Day range must satisfy 1 <= start_day <= end_day <= 31")
+
+        job_id = uuid.uuid4().hex
+        daily_file = os.path.join(self.upload_dir, f"{job_id}.xlsx")
+        output = os.path.join(self.output_dir, f"{job_id}.{SAVER_EXTENSIONS[self.saver_engine]}")
+        job = Job(
+            job_id=job_id,
+            daily_file=daily_file,
+            output=output,
+            start_day=start_day,
+            end_day=end_day,
+            created_at=time.time(),
+        )
+
+        with open(daily_file, "wb") as f:
+            f.write(content)
+
+        with self._lock:
+            self.jobs[job_id] = job
+            # thread های worker این شی را تغییر می‌دهند؛ یک کپی از وضعیت queued برمی‌گردانیم
+            snapshot = job.model_copy(deep=True)
+        try:
+            self._queue.put_nowait(job_id)
+        except queue.Full:
+            with self._lock:
+                del self.jobs[job_id]
+            os.remove(daily_file)
+            logger.warning(f"[JobQueue] [Job:{job_id}] [Status:rejected] Queue is full")
+            raise
+
+        logger.info(f"[JobQueue] [Job:{job_id}] [Status:queued] Size={len(content)} bytes")
+        return snapshot
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            job = self.jobs.get(job_id)
+            return job.model_copy(deep=True) if job else None
+
+    def list(self) -> list[Job]:
+        with self._lock:
+            return [job.model_copy(deep=True) for job in self.jobs.values()]
+
+    def _prune(self):
+        """قدیمی‌ترین کارهای تمام شده را حذف می‌کند؛ باید با self._lock صدا زده شود"""
+
+        finished = [job for job in self.jobs.values() if job.finished_at is not None]
+        if len(finished) <= self.keep_jobs:
+            return
+        finished.sort(key=lambda job: job.finished_at)
+        for job in finished[: len(finished) - self.keep_jobs]:
+            del self.jobs[job.job_id]
+
+    def _work(self):
+        while not self._stopping.is_set():
+            try:
+                job_id = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            try:
+                self._run(job_id)
+            except Exception:
+                # هیچ خطای غیرمنتظره‌ای نباید thread را از کار بیندازد
+                logger.exception(f"[JobQueue] [Job:{job_id}] Unexpected error in dispatcher")
+            finally:
+                self._queue.task_done()
+
+    def _run(self, job_id: str):
+        with self._lock:
+            job = self.jobs[job_id]
+            job.status = "running"
+            job.started_at = time.time()
+            job.timings = {"queued": job.started_at - job.created_at}
+        logger.info(f"[JobQueue] [Job:{job_id}] [Status:running]")
+
+        pool = self._pool
+        try:
+            future = pool.submit(
+                run_job,
+                daily_file=job.daily_file,
+                start_day=job.start_day,
+                end_day=job.end_day,
+                extract_engine=self.extract_engine,
+                saver_engine=self.saver_engine,
+                output=job.output,
+            )
+            result = future.result()
+        except BrokenProcessPool as e:
+            result = {"error": f"{type(e).__name__}: {e}"}
+            self._replace_pool(pool)
+        except Exception as e:
+            result = {"error": f"{type(e).__name__}: {e}"}
+        finally:
+            # فایل آپلود شده بعد از پردازش لازم نیست؛ خروجی در output_dir می‌ماند
+            try:
+                os.remove(job.daily_file)
+            except OSError as e:
+                logger.warning(f"[JobQueue] [Job:{job_id}] Could not remove upload: {e}")
+
+        with self._lock:
+            job.finished_at = time.time()
+            job.error = result["error"]
+            job.status = "failed" if job.error else "done"
+            job.saved_records = result.get("saved_records", 0)
+            job.validation_errors = [CellError(**err) for err in result.get("validation_errors", [])]
+            job.timings.update(result.get("timings", {}))
+            job.timings["total"] = job.finished_at - job.started_at
+            self._prune()
+
+        if job.error:
+            logger.error(f"[JobQueue] [Job:{job_id}] [Status:failed] {job.error}")
+        else:
+            logger.info(f"[JobQueue] [Job:{job_id}] [Status:done] Records={job.saved_records}")
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    """
+    POST /jobs?start_day=1&end_day=31   بدنه درخواست: محتوای فایل xlsx
+    GET  /jobs                          لیست همه کارها
+    GET  /jobs/<job_id>                 وضعیت و زمان‌بندی مراحل یک کار
+    """
+
+    server: "JobServer"
+
+    def _send_json(self, status: int, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlparse(self.path).path.rstrip("/")
+        if path == "/jobs":
+            self._send_json(200, [job.model_dump() for job in self.server.jobs.list()])
+            return
+
+        if path.startswith("/jobs/"):
+            job = self.server.jobs.get(path.removeprefix("/jobs/"))
+            if job is None:
+                self._send_json(404, {"error": "Job not found"})
+            else:
+                self._send_json(200, job.model_dump())
+            return
+
+        self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path.rstrip("/") != "/jobs":
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            self._send_json(400, {"error": "Content-Length header must be an integer"})
+            return
+        if length <= 0:
+            self._send_json(400, {"error": "Request body must contain the xlsx file"})
+            return
+        if length > self.server.max_upload:
+            self._send_json(413, {"error": "Uploaded file is too large"})
+            return
+        content = self.rfile.read(length)
+
+        query = parse_qs(url.query)
+        try:
+            start_day = int(query.get("start_day", ["1"])[0])
+            end_day = int(query.get("end_day", ["31"])[0])
+        except ValueError:
+            self._send_json(400, {"error": "start_day and end_day must be integers"})
+            return
+
+        try:
+            job = self.server.jobs.submit(content, start_day=start_day, end_day=end_day)
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except queue.Full:
+            self._send_json(503, {"error": "Job queue is full, try again later"})
+            return
+
+        self._send_json(202, {"job_id": job.job_id, "status": job.status})
+
+    def log_message(self, format, *args):
+        logger.debug(f"[JobServer] [Request] {self.address_string()} {format % args}")
+
+
+class JobServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], jobs: JobQueue, max_upload: int):
+        super().__init__(address, JobRequestHandler)
+        self.jobs = jobs
+        self.max_upload = max_upload
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local HTTP ingestion service for daily.xlsx")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-queue", type=int, default=100)
+    parser.add_argument("--max-upload-mb", type=int, default=50)
+    parser.add_argument("--keep-jobs", type=int, default=1000)
+    parser.add_argument("--extract-engine", choices=["openpyxl", "pandas"], default="openpyxl")
+    parser.add_argument("--saver-engine", choices=list(SAVER_EXTENSIONS), default="csv")
+    parser.add_argument("--upload-dir", default=os.path.join("DataBase", "uploads"))
+    parser.add_argument("--output-dir", default=os.path.join("DataBase", "jobs"))
+    args = parser.parse_args()
+
+    for name in ("workers", "max_queue", "max_upload_mb", "keep_jobs"):
+        if getattr(args, name) < 1:
+            parser.error(f"--{name.replace('_', '-')} must be at least 1")
+
+    jobs = JobQueue(
+        workers=args.workers,
+        max_queue=args.max_queue,
+        extract_engine=args.extract_engine,
+        saver_engine=args.saver_engine,
+        upload_dir=args.upload_dir,
+        output_dir=args.output_dir,
+        keep_jobs=args.keep_jobs,
+    ).start()
+    server = JobServer((args.host, args.port), jobs, max_upload=args.max_upload_mb * 1024 * 1024)
+    logger.info(f"[JobServer] [Start] Listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("[JobServer] [Stop] Interrupted by user")
+    finally:
+        server.server_close()
+        jobs.stop()
+
+
+if __name__ == "__main__":
+    main()
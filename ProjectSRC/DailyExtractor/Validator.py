@@ -0,0 +1,171 @@
+import datetime
+import math
+import re
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+import jdatetime  # type: ignore
+from openpyxl.utils import get_column_letter  # type: ignore
+from pydantic import BaseModel
+
+from ProjectSRC.Logger.logger_config import logger  # type: ignore
+
+# اعتبارسنجی در سطح شیت: تاریخ E4 و ستون ساعت فقط یک بار برای هر شیت بررسی می‌شوند
+# و ستون‌های عددی به صورت یکجا با قوانین از پیش ساخته شده اعتبارسنجی می‌شوند
+
+FIRST_ROW = 4  # داده‌ها از سلول A4 شروع می‌شوند
+FIRST_DATA_INDEX = 8  # اولین ردیف نتایج (سطر 12 اکسل)
+DATE_CELL = (0, 4)  # E4
+TIME_COLUMN = 0  # A
+NOT_TESTED = "Not Tested"
+DATE_PATTERN = re.compile(r"^(\d{4})/(\d{1,2})/(\d{1,2})$")
+# متنی که شبیه ساعت است ولی به صورت time ذخیره نشده (مثلا '9:30')
+TIME_PATTERN = re.compile(r"^\d{1,2}[:.]\d{2}(:\d{2})?$")
+# اگر همه این ستون‌ها در سلول‌های اکسل خالی باشند ردیف ثبت نمی‌شود
+REQUIRED_FIELDS = ("klin1", "klin2", "above40", "par05")
+
+
+class CellError(BaseModel):
+    """خطای یک سلول با مختصات قابل پیگیری برای تکنسین"""
+
+    sheet: str
+    row: int
+    column: str
+    value: str
+    message: str
+
+    @property
+    def coordinate(self) -> str:
+        return f"{self.sheet}!{self.column}{self.row}"
+
+    def __str__(self):
+        return f"[{self.coordinate}] {self.message} (value={self.value!r})"
+
+
+class NumericRule(BaseModel):
+    """قانون اعتبارسنجی یک ستون عددی؛ مقدار غیرعددی به Not Tested تبدیل و گزارش می‌شود"""
+
+    field: str
+    column: int
+    quantum: Decimal
+    # ذرات از ردیف بعدی خوانده می‌شوند و فقط برای ردیف‌های محدودی ثبت شده‌اند
+    row_offset: int = 0
+    last_index: int | None = None
+
+
+NUMERIC_RULES = (
+    NumericRule(field="klin1", column=1, quantum=Decimal("0.01")),
+    NumericRule(field="klin2", column=3, quantum=Decimal("0.01")),
+    NumericRule(field="above40", column=5, quantum=Decimal("0.01")),
+    NumericRule(field="par05", column=8, quantum=Decimal("0.1"), row_offset=1, last_index=19),
+    NumericRule(field="par51", column=9, quantum=Decimal("0.1"), row_offset=1, last_index=19),
+    NumericRule(field="par60", column=11, quantum=Decimal("0.1")),
+)
+
+
+def _is_empty(value) -> bool:
+    # pandas سلول خالی را به صورت NaN برمی‌گرداند
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+class SheetValidator:
+    """اعتبارسنجی یکجای داده‌های خام یک شیت؛ خروجی آن مستقیما به LabResult داده می‌شود"""
+
+    def __init__(self, raw_data: list[list], sheet: str = "", rules=NUMERIC_RULES):
+        self.raw_data = raw_data
+        self.sheet = sheet
+        self.rules = rules
+        self.errors: list[CellError] = []
+        self.date: tuple[str, str, str] | None = None
+        self.times: dict[int, str] = {}
+        self.values: dict[str, dict[int, str]] = {}
+        # ردیف‌هایی که حداقل یکی از REQUIRED_FIELDS در اکسل پر شده باشد
+        self.filled: set[int] = set()
+
+    def _error(self, index: int, column: int, value, message: str):
+        error = CellError(
+            sheet=self.sheet,
+            row=index + FIRST_ROW,
+            column=get_column_letter(column + 1),
+            value=str(value),
+            message=message,
+        )
+        logger.warning(f"[SheetValidator] [Cell:{error.coordinate}] [Status:invalid] {message}")
+        self.errors.append(error)
+
+    def _cell(self, index: int, column: int):
+        if index >= len(self.raw_data) or column >= len(self.raw_data[index]):
+            return None
+        return self.raw_data[index][column]
+
+    def validate_date(self):
+        row, column = DATE_CELL
+        value = self._cell(row, column)
+        match = DATE_PATTERN.match(str(value).strip()) if not _is_empty(value) else None
+        if match is None:
+            self._error(row, column, value, "Date must be in YYYY/MM/DD format")
+            return self
+
+        year, month, day = (int(part) for part in match.groups())
+        if year < 1400:
+            self._error(row, column, value, "Year must be between 1400 and above")
+            return self
+        try:
+            jdatetime.date(year, month, day)
+        except ValueError as e:
+            self._error(row, column, value, f"Invalid Jalali date: {e}")
+            return self
+
+        self.date = (f"{year:04d}", f"{month:02d}", f"{day:02d}")
+        logger.debug(f"[SheetValidator] [Sheet:{self.sheet}] [Date:valid] {self.date}")
+        return self
+
+    def validate_times(self):
+        for i in range(FIRST_DATA_INDEX, len(self.raw_data)):
+            value = self._cell(i, TIME_COLUMN)
+            if isinstance(value, (datetime.time, datetime.datetime)):
+                self.times[i] = value.strftime("%H%M")
+            elif isinstance(value, str) and TIME_PATTERN.match(value.strip()):
+                # برچسب‌ها و متن‌های دیگر ستون A مثل قبل بدون گزارش رد می‌شوند
+                self._error(i, TIME_COLUMN, value, "Time must be entered as a time value")
+        return self
+
+    def validate_numbers(self):
+        for rule in self.rules:
+            column_values: dict[int, str] = {}
+            for i in self.times:
+                if rule.last_index is not None and i > rule.last_index:
+                    column_values[i] = NOT_TESTED
+                    continue
+
+                source = i + rule.row_offset
+                value = self._cell(source, rule.column)
+                if _is_empty(value):
+                    column_values[i] = NOT_TESTED
+                    continue
+                if rule.field in REQUIRED_FIELDS:
+                    self.filled.add(i)
+
+                try:
+                    number = Decimal(str(value).strip())
+                    if not number.is_finite():
+                        raise InvalidOperation
+                except (InvalidOperation, ValueError):
+                    self._error(source, rule.column, value, f"{rule.field} must be numeric")
+                    column_values[i] = NOT_TESTED
+                    continue
+
+                column_values[i] = str(number.quantize(rule.quantum, rounding=ROUND_HALF_UP))
+            self.values[rule.field] = column_values
+        return self
+
+    def validate(self):
+        self.validate_date()
+        if self.date is None:
+            # بدون تاریخ معتبر هیچ رکوردی از این شیت قابل ساخت نیست
+            return self
+        self.validate_times().validate_numbers()
+        logger.info(
+            f"[SheetValidator] [Sheet:{self.sheet}] [Status:done] "
+            f"Rows={len(self.times)} Errors={len(self.errors)}"
+        )
+        return self
@@ -1,4 +1,5 @@
 import logging
+import multiprocessing
 import os
 from logging.handlers import RotatingFileHandler
 
@@ -21,16 +22,19 @@ console_handler.setLevel(logging.INFO)
 console_handler.setFormatter(formatter)
 
 # هندلر برای فایل با چرخش (در همان پوشه logger_config.py)
+# delay=True: فایل تا اولین لاگ باز نمی‌شود
 file_handler = RotatingFileHandler(
-    log_path, maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8"
+    log_path, maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8", delay=True
 )
 file_handler.setLevel(logging.DEBUG)
 file_handler.setFormatter(formatter)
 
 # جلوگیری از دوباره اضافه شدن هندلرها
+# RotatingFileHandler فقط در یک پردازش امن است؛ پردازش‌های فرزند در فایل نمی‌نویسند
 if not logger.handlers:
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    if multiprocessing.parent_process() is None:
+        logger.addHandler(file_handler)
 
 logger.debug("Logger initialized, file handler active.")
 